@@ -16,17 +16,21 @@ Apply changes:        python sims4_mod_fixer.py --apply
 Automated run:        python sims4_mod_fixer.py --apply --auto
 """
 
-import argparse, hashlib, shutil, sys, textwrap, zipfile
+import argparse, functools, hashlib, mmap, os, re, shutil, sys, textwrap, threading, time, zipfile
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional
 
-from colorama import Fore, Style
-from tqdm import tqdm
-import json
-import tkinter as tk
-from tkinter import messagebox
-import subprocess
+# colorama, tqdm, tkinter and the archive libraries are imported where they're
+# first used, so --help and --gui don't pay for modules they never touch
+
+try:
+    from blake3 import blake3 as _blake3  # optional: SIMD hashing, much faster than hashlib
+except ImportError:
+    _blake3 = None
 
 # ───────────────── CONFIG ─────────────────
 MODS_DIR       = Path.home() / "Documents/Electronic Arts/The Sims 4/Mods"
@@ -34,6 +38,7 @@ DESKTOP        = Path.home() / "Desktop"
 BACKUP_NAME    = f"ModsBackup-{datetime.now():%Y%m%d}.zip"
 QUARANTINE_DIR = DESKTOP / "Sims4_Mod_Quarantine"
 MAX_DEPTH      = 5
+COPY_BUF       = 1 << 20   # buffer size for file copies and backup read-ahead
 
 # Category keywords (edit to taste, all lowercase)
 CATEGORY_MAP: Dict[str, List[str]] = {
@@ -50,111 +55,278 @@ CATEGORY_MAP: Dict[str, List[str]] = {
 }
 ARCHIVE_EXT = {".zip", ".rar", ".7z"}
 PACKAGE_EXT = {".package", ".ts4script"}
+TGIN_RE     = re.compile(rb"TGIN.{0,12}", re.DOTALL)  # marker + rest of the 16-byte key
+PYC_MAGIC_310 = 3430  # first Python 3.10 bytecode magic; 3.x before it is 3000–3429
+
+_CATEGORY_BY_LOWER = {cat.lower(): cat for cat in CATEGORY_MAP}
+
+# CATEGORY_MAP precompiled, in order: (category, suffixes, keyword regex or None)
+_CATEGORY_RULES = [
+    (cat,
+     {k for k in keys if k.startswith(".")},
+     re.compile("|".join(re.escape(k) for k in keys if not k.startswith(".")))
+     if any(not k.startswith(".") for k in keys) else None)
+    for cat, keys in CATEGORY_MAP.items()
+]
 
 # ──────────────── helpers ────────────────
-def c(msg, col):  # colorful print helper
-    return f"{col}{msg}{Style.RESET_ALL}"
-
-def is_old_ts4script(file: Path) -> bool:
-    """Return True if .ts4script file is compiled with old (pre-3.10) Python."""
-    with file.open("rb") as f:
-        head = f.read(4)
-        return head in {b'\x42\x0D\x0D\x0A', b'\x33\x0D\x0D\x0A'}  # py 3.7/3.8/3.9
-
-def md5(file: Path, chunk=8192) -> str:
-    h = hashlib.md5()
-    with file.open("rb") as f:
-        for part in iter(lambda: f.read(chunk), b""):
-            h.update(part)
+@functools.lru_cache(maxsize=None)
+def _colorama():
+    import colorama
+    return colorama
+
+def c(msg, col):  # colorful print helper; col is a colorama Fore name, e.g. "GREEN"
+    cr = _colorama()
+    return f"{getattr(cr.Fore, col)}{msg}{cr.Style.RESET_ALL}"
+
+def progress(iterable, desc: str, total: Optional[int] = None):
+    # tqdm with throttled refreshes: about 200 redraws per bar at most
+    from tqdm import tqdm
+    if total is None:
+        total = len(iterable)
+    return tqdm(iterable, desc=desc, total=total,
+                miniters=max(1, total // 200), mininterval=0.2, smoothing=0)
+
+def iter_files(root) -> Iterator[os.DirEntry]:
+    """Yield every regular file under root using os.scandir (no Path objects)."""
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        try:
+            it = os.scandir(folder)
+        except OSError as err:  # unreadable folder: skip it, like Path.rglob
+            print(c(f" ! Skipping unreadable folder {folder} → {err}", "YELLOW"))
+            continue
+        with it:
+            for e in it:
+                try:
+                    if e.is_dir(follow_symlinks=False):
+                        stack.append(e.path)
+                    elif e.is_file():
+                        yield e
+                except OSError:
+                    continue
+
+@dataclass(slots=True)
+class FileRec:
+    """One file seen by scan_mods(); path is updated when the file is moved."""
+    path: str
+    size: int
+    ctime: float
+    mtime: float
+    mode: int
+    suffix: str
+    name: str
+
+def scan_mods(mods: Path) -> List[FileRec]:
+    """Walk mods once and stat every file, for reuse by all later steps."""
+    records = []
+    for e in iter_files(mods):
+        try:
+            st = e.stat()
+        except OSError:
+            continue  # vanished or unreadable since the directory listing
+        suffix = os.path.splitext(e.name)[1].lower()
+        records.append(FileRec(e.path, st.st_size, st.st_ctime, st.st_mtime,
+                               st.st_mode, suffix, e.name))
+    return records
+
+def read_header(path: str, n: int = 4) -> bytes:
+    # Raw os.open/os.read: no Python file object for a few bytes. O_BINARY keeps
+    # Windows from opening in text mode (\r\n translation, stop at \x1a).
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        return os.read(fd, n)
+    finally:
+        os.close(fd)
+
+def check_package_headers(records: List[FileRec]) -> tuple[List[FileRec], List[FileRec], List[FileRec]]:
+    """Read each mod's header once; return (broken, corrupt, old_scripts) records.
+
+    A .ts4script is a zip, so scripts are checked through is_old_ts4script()
+    instead of the 4-byte DBPF header.
+    """
+    broken, corrupt, old_scripts = [], [], []
+    for rec in records:
+        if rec.suffix not in PACKAGE_EXT:
+            continue
+        is_script = rec.suffix == ".ts4script"
+        if rec.size == 0:
+            broken.append(rec)
+            if not is_script:
+                corrupt.append(rec)
+            continue
+        if is_script:                   # script mod, not a DBPF package
+            try:
+                if is_old_ts4script(rec.path):
+                    old_scripts.append(rec)
+            except (OSError, zipfile.BadZipFile):
+                broken.append(rec)
+            continue
+        try:
+            head = read_header(rec.path)
+        except OSError:
+            broken.append(rec)
+            corrupt.append(rec)
+            continue
+        if head != b"DBPF":
+            corrupt.append(rec)
+    return broken, corrupt, old_scripts
+
+def is_old_ts4script(file) -> bool:
+    """Return True if .ts4script file is compiled with old (pre-3.10) Python.
+
+    Only the magic number of the first .pyc member inside the zip is read.
+    """
+    with zipfile.ZipFile(file) as z:
+        for info in z.infolist():
+            if info.filename.lower().endswith(".pyc"):
+                with z.open(info) as f:
+                    head = f.read(4)
+                magic = int.from_bytes(head[:2], "little")
+                return head[2:4] == b"\r\n" and 3000 <= magic < PYC_MAGIC_310
+    return False
+
+_hash_local = threading.local()  # per-thread read buffer for content_hash()
+
+def content_hash(file, chunk=1 << 20) -> str:
+    """Hash file contents for duplicate detection (BLAKE3 if installed, else SHA-256)."""
+    if _blake3 is not None:
+        return _blake3().update_mmap(file).hexdigest()
+    with open(file, "rb", buffering=0) as f:
+        # Big files: hash the whole mmap in one C-level update, no bytes copies
+        if os.fstat(f.fileno()).st_size > chunk:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha256(mm).hexdigest()
+        # Small files: readinto this thread's buffer, reused for every file it hashes
+        buf = getattr(_hash_local, "buf", None)
+        if buf is None or len(buf) < chunk:
+            buf = _hash_local.buf = bytearray(chunk)
+        view = memoryview(buf)
+        h = hashlib.sha256()
+        while n := f.readinto(buf):
+            h.update(view[:n])
     return h.hexdigest()
 
-def zip_backup(src: Path, dst: Path) -> None:
-    # Backup all files under src into a zip archive at dst
-    with zipfile.ZipFile(dst, "w", zipfile.ZIP_DEFLATED) as zf:
-        for f in tqdm(list(src.rglob("*")), desc="Creating backup ZIP"):
-            if f.is_file():
-                zf.write(f, f.relative_to(src))
+def zip_backup(src: Path, dst: Path, records: List[FileRec], workers: int = 4) -> None:
+    # Backup the scanned files under src into a zip archive at dst, reusing the
+    # scan's stat data; small files are read ahead on threads while the writer deflates.
+    def load(path: str) -> bytes:
+        with open(path, "rb") as f:
+            return f.read()
+
+    def zip_info(rec: FileRec) -> zipfile.ZipInfo:
+        # Same metadata ZipInfo.from_file() would record, without another stat()
+        date_time = max(time.localtime(rec.mtime)[:6], (1980, 1, 1, 0, 0, 0))
+        zi = zipfile.ZipInfo(os.path.relpath(rec.path, src), date_time)
+        zi.external_attr = (rec.mode & 0xFFFF) << 16
+        zi.file_size = rec.size
+        zi.compress_type = zipfile.ZIP_DEFLATED
+        return zi
+
+    def flush(entry) -> None:
+        rec, data = entry
+        zi = zip_info(rec)
+        if data is None:  # big file: stream it through in COPY_BUF chunks
+            with open(rec.path, "rb") as fsrc, zf.open(zi, "w") as fdst:
+                shutil.copyfileobj(fsrc, fdst, COPY_BUF)
+        else:
+            zf.writestr(zi, data.result())
+
+    with zipfile.ZipFile(dst, "w", zipfile.ZIP_DEFLATED) as zf, \
+         ThreadPoolExecutor(max_workers=workers) as ex:
+        pending = deque()
+        for rec in progress(records, "Creating backup ZIP"):
+            small = rec.size <= 8 * COPY_BUF
+            pending.append((rec, ex.submit(load, rec.path) if small else None))
+            if len(pending) > 2 * workers:
+                flush(pending.popleft())
+        while pending:
+            flush(pending.popleft())
+
+def move_file(src, dst) -> None:
+    # os.replace is a single rename syscall; fall back to shutil.move across devices
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.move(src, dst)
 
 def extract_archive(arc: Path, dest: Path) -> bool:
-    import zipfile, rarfile, py7zr
     dest.mkdir(parents=True, exist_ok=True)
+    suffix = arc.suffix.lower()
     try:
-        if arc.suffix == ".zip":
+        if suffix == ".zip":
             with zipfile.ZipFile(arc) as z: z.extractall(dest)
-        elif arc.suffix == ".rar":
+        elif suffix == ".rar":
+            import rarfile
             with rarfile.RarFile(arc) as r: r.extractall(dest)
-        elif arc.suffix == ".7z":
+        elif suffix == ".7z":
+            import py7zr
             with py7zr.SevenZipFile(arc) as s: s.extractall(dest)
+        else:
+            return False
         return True
     except Exception as e:
-        print(c(f" ! Extract failed: {arc.name} → {e}", Fore.YELLOW))
+        print(c(f" ! Extract failed: {arc.name} → {e}", "YELLOW"))
         return False
 
-def category_for(file: Path) -> str:
+def category_for(file) -> str:
     # Determine category folder based on filename or extension
-    name = file.name.lower()
-    for cat, keys in CATEGORY_MAP.items():
-        for k in keys:
-            if k.startswith("."):
-                if file.suffix.lower() == k:
-                    return cat
-            elif k in name:
-                return cat
+    return category_for_name(file.name.lower(), file.suffix.lower())
+
+@functools.lru_cache(maxsize=None)
+def category_for_name(name_lower: str, suffix: str) -> str:
+    for cat, suffixes, keywords in _CATEGORY_RULES:
+        if suffix in suffixes or (keywords and keywords.search(name_lower)):
+            return cat
     return "_Unsorted"
 
 def standardize_folder_names(mods: Path) -> None:
     """Rename folders in Mods to match standard category names."""
     renamed = 0
-    for folder in mods.iterdir():
-        if folder.is_dir():
-            clean_name = folder.name.strip().replace(" ", "-").title()
-            for category in CATEGORY_MAP:
-                if clean_name.lower() == category.lower():
-                    if folder.name != category:
-                        new_path = mods / category
-                        if not new_path.exists():
-                            folder.rename(new_path)
-                            renamed += 1
+    with os.scandir(mods) as it:
+        folders = [e for e in it if e.is_dir()]
+    for folder in folders:
+        category = _CATEGORY_BY_LOWER.get(folder.name.strip().replace(" ", "-").lower())
+        if category and folder.name != category:
+            new_path = mods / category
+            if not new_path.exists():
+                os.rename(folder.path, new_path)
+                renamed += 1
     if renamed:
-        print(c(f"📁 Standardized {renamed} folder name(s)", Fore.GREEN))
-
-def export_mod_inventory_to_json(mods: Path, output_path: Path) -> None:
-    inventory = []
-    for file in mods.rglob("*"):
-        if file.suffix.lower() in {".package", ".ts4script"}:
-            entry = {
-                "name": file.name,
-                "path": str(file.relative_to(mods)),
-                "size_kb": round(file.stat().st_size / 1024, 2),
-                "category": category_for(file),
-                "added": datetime.fromtimestamp(file.stat().st_ctime).isoformat()
-            }
-            inventory.append(entry)
-    with open(output_path, "w") as f:
-        json.dump(inventory, f, indent=2)
-    print(c(f"🗃️ Exported mod inventory to {output_path}", Fore.GREEN))
-
-def export_mod_inventory_to_csv(mods: Path, output_path: Path) -> None:
-    import csv
-    inventory = []
-    for file in mods.rglob("*"):
-        if file.suffix.lower() in {".package", ".ts4script"}:
-            entry = {
-                "name": file.name,
-                "path": str(file.relative_to(mods)),
-                "size_kb": round(file.stat().st_size / 1024, 2),
-                "category": category_for(file),
-                "added": datetime.fromtimestamp(file.stat().st_ctime).isoformat()
-            }
-            inventory.append(entry)
+        print(c(f"📁 Standardized {renamed} folder name(s)", "GREEN"))
+
+INVENTORY_FIELDS = ("name", "path", "size_bytes", "category", "added")
 
+def _build_inventory(mods: Path, records: List[FileRec]) -> List[tuple]:
+    # One row per mod file (INVENTORY_FIELDS order), shared by the JSON and CSV exporters
+    return [
+        (rec.name, os.path.relpath(rec.path, mods), rec.size, category_for(rec),
+         datetime.fromtimestamp(rec.ctime).isoformat())
+        for rec in records if rec.suffix in PACKAGE_EXT
+    ]
+
+def export_mod_inventory_to_json(inventory: List[tuple], output_path: Path) -> None:
+    entries = [dict(zip(INVENTORY_FIELDS, row)) for row in inventory]
+    try:
+        import orjson  # optional, much faster than json for indented output
+        data = orjson.dumps(entries, option=orjson.OPT_INDENT_2)
+    except ImportError:
+        import json
+        data = json.dumps(entries, indent=2).encode()
+    output_path.write_bytes(data)
+    print(c(f"🗃️ Exported mod inventory to {output_path}", "GREEN"))
+
+def export_mod_inventory_to_csv(inventory: List[tuple], output_path: Path) -> None:
+    import csv
     with open(output_path, "w", newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=["name", "path", "size_kb", "category", "added"])
-        writer.writeheader()
-        writer.writerows(inventory)
-    print(c(f"📄 Exported mod inventory to {output_path}", Fore.GREEN))
+        writer = csv.writer(f)
+        writer.writerow(["name", "path", "size_kb", "category", "added"])
+        for name, path, size, category, added in inventory:
+            writer.writerow((name, path, f"{size / 1024:.2f}", category, added))
+    print(c(f"📄 Exported mod inventory to {output_path}", "GREEN"))
 
-def check_mod_versions(mods: Path, version_file: Path) -> None:
+def check_mod_versions(records: List[FileRec], version_file: Path) -> None:
     """
     Check mods against a JSON file of known latest versions.
     JSON format should be:
@@ -165,33 +337,34 @@ def check_mod_versions(mods: Path, version_file: Path) -> None:
         }
     }
     """
+    import json
     try:
         with open(version_file, "r") as f:
             known_versions = json.load(f)
     except Exception as e:
-        print(c(f" ! Could not load version file: {e}", Fore.YELLOW))
+        print(c(f" ! Could not load version file: {e}", "YELLOW"))
         return
 
     outdated = []
-    for file in mods.rglob("*"):
-        if file.suffix.lower() in {".package", ".ts4script"}:
-            name = file.name
+    for rec in records:
+        if rec.suffix in PACKAGE_EXT:
+            name = rec.name
             if name in known_versions:
                 info = known_versions[name]
                 latest_time = datetime.fromisoformat(info["latest"])
-                file_time = datetime.fromtimestamp(file.stat().st_ctime)
+                file_time = datetime.fromtimestamp(rec.ctime)
                 if file_time < latest_time:
-                    outdated.append((file, latest_time.date(), file_time.date(), info.get("url")))
+                    outdated.append((Path(rec.path), latest_time.date(), file_time.date(), info.get("url")))
 
     if outdated:
-        print(c("\n🔎 Outdated Mods Found:", Fore.YELLOW))
+        print(c("\n🔎 Outdated Mods Found:", "YELLOW"))
         for file, latest, current, url in outdated:
             print(f" - {file.name}: Installed {current}, Latest {latest}")
             if url:
                 print(f"   ➜ Attempting to auto-download from {url}")
                 download_file(url, file)
     else:
-        print(c("✓ All mods are up to date.", Fore.GREEN))
+        print(c("✓ All mods are up to date.", "GREEN"))
 
 
 # Helper function for downloading a file from a URL to a destination path
@@ -199,28 +372,31 @@ def download_file(url: str, dest: Path) -> bool:
     try:
         import urllib.request
         with urllib.request.urlopen(url) as response, open(dest, 'wb') as out_file:
-            shutil.copyfileobj(response, out_file)
-        print(c(f"⬇️ Downloaded update for {dest.name}", Fore.GREEN))
+            shutil.copyfileobj(response, out_file, COPY_BUF)
+        print(c(f"⬇️ Downloaded update for {dest.name}", "GREEN"))
         return True
     except Exception as e:
-        print(c(f" ! Failed to download {dest.name} → {e}", Fore.YELLOW))
+        print(c(f" ! Failed to download {dest.name} → {e}", "YELLOW"))
         return False
 
-def clean_garbage_files(mods: Path) -> None:
-    # Remove common unwanted system files from mods folder
+def clean_garbage_files(records: List[FileRec]) -> List[FileRec]:
+    # Remove common unwanted system files from mods folder; returns the records left
     garbage = {".DS_Store", "Thumbs.db", "desktop.ini"}
-    removed = []
+    removed, kept = [], []
 
-    for file in mods.rglob("*"):
-        if file.name in garbage:
+    for rec in records:
+        if rec.name in garbage:
             try:
-                file.unlink()
-                removed.append(file)
+                os.unlink(rec.path)
+                removed.append(rec)
+                continue
             except Exception as e:
-                print(c(f" ! Failed to delete {file} → {e}", Fore.YELLOW))
+                print(c(f" ! Failed to delete {rec.path} → {e}", "YELLOW"))
+        kept.append(rec)
 
     if removed:
-        print(c(f"🧹 Removed {len(removed)} garbage files", Fore.GREEN))
+        print(c(f"🧹 Removed {len(removed)} garbage files", "GREEN"))
+    return kept
 
 def rewrite_resource_cfg(mods: Path) -> None:
     # Rewrite Resource.cfg with appropriate priority and package paths
@@ -231,38 +407,45 @@ def rewrite_resource_cfg(mods: Path) -> None:
         for depth in range(1, MAX_DEPTH)
     ]
     cfg.write_text("".join(lines))
-    print(c("✓ Resource.cfg rewritten (depth 5).", Fore.GREEN))
+    print(c("✓ Resource.cfg rewritten (depth 5).", "GREEN"))
 
 # — SECTION 1️⃣ Backup — (starts line 103)
 def extract_archives(archives: list[Path], qdir: Path) -> None:
-    # Extract archives to quarantine directory
-    extracted = []
-    for arc in archives:
+    # Extract archives to quarantine directory, several at a time
+    def unpack(arc: Path) -> bool:
         try:
             shutil.unpack_archive(arc, qdir / arc.stem)
-            extracted.append(arc)
+            return True
         except Exception as e:
-            print(c(f" ! Failed to extract {arc} → {e}", Fore.YELLOW))
+            print(c(f" ! Failed to extract {arc} → {e}", "YELLOW"))
+            return False
+
+    # Archives sharing a stem unpack into the same folder, so each such group
+    # runs in order on one worker; only separate groups run concurrently.
+    groups: Dict[str, List[Path]] = defaultdict(list)
+    for arc in archives:
+        groups[arc.stem.lower()].append(arc)
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        results = ex.map(lambda group: [unpack(arc) for arc in group], groups.values())
+        extracted = [arc for group, oks in zip(groups.values(), results)
+                     for arc, ok in zip(group, oks) if ok]
 
     if extracted:
-       print(c(f"📦 Extracted {len(extracted)} archive(s) to quarantine", Fore.GREEN))
+       print(c(f"📦 Extracted {len(extracted)} archive(s) to quarantine", "GREEN"))
 
 # — SECTION 2️⃣ Read TGI keys — (starts line 117)
-def read_tgi_keys(pkg_path):
-    # Read TGI keys from package file for conflict detection
+def read_tgi_keys(pkg_path: str) -> set[bytes]:
+    # Read TGI keys from package file for conflict detection (runs in worker processes)
     keys = set()
     try:
-        if not pkg_path.exists():
-            return keys  # Skip files that no longer exist
-        with pkg_path.open("rb") as f:
-            data = f.read()
-            offset = 0
-            while True:
-                idx = data.find(b'TGIN', offset)
-                if idx == -1:
-                    break
-                keys.add(data[idx:idx+16])
-                offset = idx + 1
+        with open(pkg_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return keys  # mmap can't map an empty file
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                keys = set(TGIN_RE.findall(mm))  # whole scan stays in C
+    except FileNotFoundError:
+        pass  # Skip files that no longer exist
     except Exception as e:
         print(f"Error reading TGI from {pkg_path}: {e}")
     return keys
@@ -283,147 +466,189 @@ def main() -> None:
         return
 
     mods = MODS_DIR.expanduser()
-    standardize_folder_names(mods)
     if not mods.exists():
-        sys.exit(c(f"Mods folder not found: {mods}", Fore.RED))
+        sys.exit(c(f"Mods folder not found: {mods}", "RED"))
+    standardize_folder_names(mods)
 
     backup_zip = DESKTOP / BACKUP_NAME
     qdir = QUARANTINE_DIR
-    print(c(f"\nMods dir: {mods}", Fore.CYAN))
-    print(c(f"Backup  → {backup_zip}", Fore.CYAN))
-    print(c(f"Quarantine → {qdir}\n", Fore.CYAN))
+    print(c(f"\nMods dir: {mods}", "CYAN"))
+    print(c(f"Backup  → {backup_zip}", "CYAN"))
+    print(c(f"Quarantine → {qdir}\n", "CYAN"))
 
-    # 1️⃣ Backup first
+    # 1️⃣ Backup first (one read-only scan up front; every later step reuses these records)
+    records = scan_mods(mods)
     if args.apply:
-        zip_backup(mods, backup_zip)
+        zip_backup(mods, backup_zip, records)
     else:
-        print(c("Dry-run → would create backup ZIP.", Fore.BLUE))
+        print(c("Dry-run → would create backup ZIP.", "BLUE"))
 
     # 2️⃣ Gather files safely
-    clean_garbage_files(mods)
+    records = clean_garbage_files(records)
+    records = clean_empty_or_tiny_mods(records, args)
     archives, packages = [], []
-    clean_empty_or_tiny_mods(mods, args)
-    for f in mods.rglob("*"):
-        if not f.is_file():
-            continue
-        ext = f.suffix.lower()
-        if ext in ARCHIVE_EXT:
-            archives.append(f)
-        elif ext in PACKAGE_EXT:
-            packages.append(f)
-
-    extract_archives(archives, qdir)
-    clean_empty_or_tiny_mods(mods, args)
-
-    # 3️⃣ Duplicate MD5 scan (before any moves)
-    md5_seen, dupes = {}, []
-    for pkg in tqdm(packages, desc="Scanning for duplicates"):
-        h = md5(pkg)
-        if h in md5_seen:
-            dupes.append(pkg)  # keep the first, quarantine others
-        else:
-            md5_seen[h] = pkg
+    for rec in records:
+        if rec.suffix in ARCHIVE_EXT:
+            archives.append(rec)
+        elif rec.suffix in PACKAGE_EXT:
+            packages.append(rec)
+
+    extract_archives([Path(arc.path) for arc in archives], qdir)
+
+    # 3️⃣ Duplicate content-hash scan (before any moves)
+    # Files of different sizes can't be identical, so only hash within size groups
+    by_size: Dict[int, List[FileRec]] = defaultdict(list)
+    for pkg in packages:
+        by_size[pkg.size].append(pkg)
+    candidates = [pkg for group in by_size.values() if len(group) > 1 for pkg in group]
+    hash_seen, dupes = {}, []
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as ex:
+        hashes = ex.map(content_hash, [pkg.path for pkg in candidates])
+        for pkg, h in progress(zip(candidates, hashes), "Scanning for duplicates", len(candidates)):
+            key = (pkg.size, h)  # one table, still scoped per size group
+            if key in hash_seen:
+                dupes.append((pkg, hash_seen[key]))  # keep the first, quarantine others
+            else:
+                hash_seen[key] = pkg
 
     # 4️⃣ Extract archives
-    for arc in tqdm(archives, desc="Extracting archives"):
-        dest_dir = mods / category_for(arc)
-        if args.apply:
-            if extract_archive(arc, dest_dir):
-                arc.unlink()
-        else:
-            print(c(f"[dry] would extract {arc.name} → {dest_dir}", Fore.BLUE))
+    known = {pkg.path for pkg in packages}
+    extracted, filled = [], set()
+    dest_dirs = [mods / category_for(arc) for arc in archives]
+    if args.apply:
+        # Archives for the same category folder extract in order on one worker
+        # (the last one wins, as before); different folders run concurrently.
+        groups: Dict[Path, List[FileRec]] = defaultdict(list)
+        for arc, dest_dir in zip(archives, dest_dirs):
+            groups[dest_dir].append(arc)
+
+        def extract_group(dest_dir: Path, group: List[FileRec]) -> List[bool]:
+            return [extract_archive(Path(arc.path), dest_dir) for arc in group]
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+            results = ex.map(extract_group, groups.keys(), groups.values())
+            for (dest_dir, group), oks in progress(zip(groups.items(), results), "Extracting archives", len(groups)):
+                for arc, ok in zip(group, oks):
+                    if ok:
+                        os.unlink(arc.path)
+                        filled.add(dest_dir)
+        for dest_dir in filled:
+            for rec in scan_mods(dest_dir):
+                if rec.suffix in PACKAGE_EXT and rec.path not in known:
+                    known.add(rec.path)
+                    extracted.append(rec)
+    else:
+        for arc, dest_dir in zip(archives, dest_dirs):
+            print(c(f"[dry] would extract {arc.name} → {dest_dir}", "BLUE"))
 #    cleanup_archives(archives)
 
     # 5️⃣ Sort packages into category folders
-    for pkg in tqdm(packages, desc="Sorting packages"):
+    if args.apply:
+        for cat in {category_for(pkg) for pkg in packages}:
+            (mods / cat).mkdir(exist_ok=True)
+    # Never rename onto a path another package already holds: that would
+    # silently overwrite it. Duplicates stay put for step 6 to quarantine.
+    dupe_ids = {id(d) for d, _ in dupes}
+    claimed = {pkg.path for pkg in packages}
+    for pkg in progress(packages, "Sorting packages"):
         cat = category_for(pkg)
         dest = mods / cat / pkg.name
-        if dest == pkg:
+        if str(dest) == pkg.path or id(pkg) in dupe_ids:
+            continue
+        if str(dest) in claimed or dest.exists():
+            print(c(f" ! {pkg.name} already exists in {cat}, left in place", "YELLOW"))
             continue
+        claimed.add(str(dest))
         if args.apply:
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.move(pkg, dest)
+            move_file(pkg.path, dest)
+            claimed.discard(pkg.path)
+            pkg.path = str(dest)
         else:
-            print(c(f"[dry] would move {pkg.name} → {cat}", Fore.BLUE))
-
-    # 6️⃣ Quarantine duplicate MD5 files
-    for d in tqdm(dupes, desc="Quarantining duplicates"):
-        if not d.exists():
-            continue  # may have been moved already
+            print(c(f"[dry] would move {pkg.name} → {cat}", "BLUE"))
+
+    # 6️⃣ Quarantine duplicate files
+    moved_out = set()
+    if args.apply and dupes:
+        qdir.mkdir(parents=True, exist_ok=True)
+    for d, kept in progress(dupes, "Quarantining duplicates"):
+        if d.path == kept.path:
+            continue  # same file on disk as the copy we keep; never move it
         if args.apply:
-            qdir.mkdir(parents=True, exist_ok=True)
             try:
-                shutil.move(d, qdir / d.name)
+                move_file(d.path, qdir / d.name)
             except FileNotFoundError:
-                continue  # skip vanished files
+                continue  # moved already or vanished
+            moved_out.add(d.path)
         else:
-            print(c(f"[dry] would quarantine duplicate {d.name}", Fore.BLUE))
+            print(c(f"[dry] would quarantine duplicate {d.name}", "BLUE"))
+    packages = [pkg for pkg in packages if pkg.path not in moved_out] + extracted
 
     # ── Embedded Resource-ID conflict scan (pure Python) ──
     conflict_output = DESKTOP / "TGI_Conflicts.csv"
-    detect_conflicting_tgi(mods, conflict_output)
+    detect_conflicting_tgi(packages, conflict_output)
 
+    # ── Broken / corrupt / unreadable package check (one header read each) ──
+    broken, corrupt_files, old_scripts = check_package_headers(packages)
     broken_output = DESKTOP / "BrokenMods.csv"
-    detect_broken_mods(mods, broken_output)
+    detect_broken_mods(broken, broken_output)
 
-    # ── Corrupt / unreadable package check ──
-    corrupt_files = []
-    for pkg in packages:
-        if pkg.suffix.lower() == ".ts4script":
-            continue      # valid script mod, not a DBPF package
-        try:
-            with pkg.open("rb") as f:
-                if f.read(4) != b"DBPF":
-                    corrupt_files.append(pkg)
-        except Exception:
-            corrupt_files.append(pkg)
+    for old in old_scripts:
+        print(c(f"Outdated script mod → {old.name} (compiled for Python < 3.10)", "YELLOW"))
 
+    if args.apply and corrupt_files:
+        qdir.mkdir(parents=True, exist_ok=True)
     for bad in corrupt_files:
         if args.apply:
-            qdir.mkdir(parents=True, exist_ok=True)
-            shutil.move(bad, qdir / bad.name)
-            print(c(f"Corrupt package → {bad.name} moved to Quarantine", Fore.YELLOW))
+            move_file(bad.path, qdir / bad.name)
+            moved_out.add(bad.path)
+            print(c(f"Corrupt package → {bad.name} moved to Quarantine", "YELLOW"))
         else:
-            print(c(f"[dry] would quarantine corrupt {bad.name}", Fore.BLUE))
+            print(c(f"[dry] would quarantine corrupt {bad.name}", "BLUE"))
 
     # 7️⃣ Update Resource.cfg
     if args.apply:
         rewrite_resource_cfg(mods)
     else:
-        print(c("[dry] would rewrite Resource.cfg.", Fore.BLUE))
+        print(c("[dry] would rewrite Resource.cfg.", "BLUE"))
 
     if args.apply:
+        packages = [pkg for pkg in packages if pkg.path not in moved_out]
+        inventory = _build_inventory(mods, packages)
         json_output = DESKTOP / "ModsInventory.json"
-        export_mod_inventory_to_json(mods, json_output)
+        export_mod_inventory_to_json(inventory, json_output)
         csv_output = DESKTOP / "ModsInventory.csv"
-        export_mod_inventory_to_csv(mods, csv_output)
+        export_mod_inventory_to_csv(inventory, csv_output)
 
         # Optional: Check mod versions if a known file is present
         version_file = Path.home() / "Desktop" / "KnownModVersions.json"
         update_url = "https://raw.githubusercontent.com/MissyAI87/sims-mod-tracker/refs/heads/main/KnownModVersions.json"  # Replace with real URL
         update_known_versions_file(update_url, version_file)
         if version_file.exists():
-            check_mod_versions(mods, version_file)
+            check_mod_versions(packages, version_file)
 
     if not args.auto:
-        print(c("\nAll done! " + ("Changes applied." if args.apply else "No files changed."), Fore.GREEN))
+        print(c("\nAll done! " + ("Changes applied." if args.apply else "No files changed."), "GREEN"))
 
 # — SECTION 4️⃣ Clean tiny mods — (starts line 190)
-def clean_empty_or_tiny_mods(mods: Path, args) -> None:
-    # Move suspiciously small mods to quarantine
+def clean_empty_or_tiny_mods(records: List[FileRec], args) -> List[FileRec]:
+    # Move suspiciously small mods to quarantine; returns the records left in Mods
     qdir = Path("~/Desktop/Sims4_Mod_Quarantine").expanduser()
-    small = []
-    for file in mods.rglob("*"):
-        if file.suffix.lower() in {".package", ".ts4script"} and file.stat().st_size < 1024:
-            small.append(file)
-    
-    for mod in small:
+    kept, small = [], []
+    for rec in records:
+        if rec.suffix not in PACKAGE_EXT or rec.size >= 1024:
+            kept.append(rec)
+        else:
+            small.append(rec)
+
+    if args.apply and small:
+        qdir.mkdir(parents=True, exist_ok=True)
+    for rec in small:
         if args.apply:
-            qdir.mkdir(parents=True, exist_ok=True)
-            shutil.move(mod, qdir / mod.name)
-            print(c(f"Too small → {mod.name} quarantined", Fore.YELLOW))
+            move_file(rec.path, qdir / rec.name)
+            print(c(f"Too small → {rec.name} quarantined", "YELLOW"))
         else:
-            print(c(f"[dry] would quarantine tiny {mod.name}", Fore.BLUE))
+            print(c(f"[dry] would quarantine tiny {rec.name}", "BLUE"))
+    return kept if args.apply else records
 
 def update_known_versions_file(url: str, dest: Path) -> None:
     try:
@@ -431,16 +656,16 @@ def update_known_versions_file(url: str, dest: Path) -> None:
         with urllib.request.urlopen(url) as response:
             data = response.read()
             dest.write_bytes(data)
-            print(c(f"🌐 Updated KnownModVersions.json from {url}", Fore.GREEN))
+            print(c(f"🌐 Updated KnownModVersions.json from {url}", "GREEN"))
     except Exception as e:
-        print(c(f" ! Failed to update KnownModVersions.json: {e}", Fore.YELLOW))
-
-if __name__ == "__main__":
-    main()
+        print(c(f" ! Failed to update KnownModVersions.json: {e}", "YELLOW"))
 
 
 # GUI launcher for Sims 4 Mod Fixer
 def launch_gui():
+    import subprocess
+    import tkinter as tk
+
     def run_fixmods():
         def task():
             result = subprocess.run(
@@ -454,7 +679,6 @@ def launch_gui():
                 output_text.insert(tk.END, result.stdout if result.stdout else "Done. Check terminal for any issues.")
             ))
 
-        import threading
         threading.Thread(target=task).start()
 
     root = tk.Tk()
@@ -471,50 +695,42 @@ def launch_gui():
 
 
 # ── TGI conflict and broken mod detection ──
-def detect_conflicting_tgi(mods: Path, output_path: Path) -> None:
+def detect_conflicting_tgi(records: List[FileRec], output_path: Path) -> None:
     # Map of TGI keys to mod files
     tgi_map = {}
     conflicts = []
 
-    for file in mods.rglob("*.package"):
-        keys = read_tgi_keys(file)
-        for key in keys:
-            if key in tgi_map:
-                conflicts.append((file.name, tgi_map[key].name))
-            else:
-                tgi_map[key] = file
+    pkgs = [rec for rec in records if rec.suffix == ".package" and rec.size > 0]
+    with ProcessPoolExecutor() as ex:
+        results = ex.map(read_tgi_keys, [rec.path for rec in pkgs], chunksize=32)
+        for rec, keys in zip(pkgs, results):
+            for key in keys:
+                if key in tgi_map:
+                    conflicts.append((rec.name, tgi_map[key]))
+                else:
+                    tgi_map[key] = rec.name
 
     if conflicts:
         with open(output_path, "w") as f:
             f.write("mod1,mod2\n")
             for m1, m2 in conflicts:
                 f.write(f"{m1},{m2}\n")
-        print(c(f"⚠️ Found TGI conflicts. Exported to {output_path}", Fore.YELLOW))
+        print(c(f"⚠️ Found TGI conflicts. Exported to {output_path}", "YELLOW"))
     else:
-        print(c("✓ No TGI conflicts found.", Fore.GREEN))
-
+        print(c("✓ No TGI conflicts found.", "GREEN"))
 
-def detect_broken_mods(mods: Path, output_path: Path) -> None:
-    broken = []
-
-    for file in mods.rglob("*"):
-        if file.suffix.lower() in {".package", ".ts4script"}:
-            try:
-                if file.stat().st_size == 0:
-                    broken.append(file.name)
-                else:
-                    with file.open("rb") as f:
-                        f.read(1)
-            except Exception:
-                broken.append(file.name)
 
+def detect_broken_mods(broken: List[FileRec], output_path: Path) -> None:
+    # Report the broken mods found by check_package_headers()
     if broken:
         with open(output_path, "w") as f:
             f.write("broken_mods\n")
-            for name in broken:
-                f.write(f"{name}\n")
-        print(c(f"🚫 Found broken mods. Exported to {output_path}", Fore.YELLOW))
+            for rec in broken:
+                f.write(f"{rec.name}\n")
+        print(c(f"🚫 Found broken mods. Exported to {output_path}", "YELLOW"))
     else:
-        print(c("✓ No broken mods found.", Fore.GREEN))
+        print(c("✓ No broken mods found.", "GREEN"))
+
 
-Add initial version of Sims 4 Mod Fixer
+if __name__ == "__main__":
+    main()